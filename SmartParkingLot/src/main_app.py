@@ -1,34 +1,133 @@
 import os
+import re
+import time
+import atexit
 import sqlite3
+from contextlib import contextmanager
 import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
+from tkinter import ttk
+
+# --------- Background gradient colours (one per pixel row) ----------
+_GRADIENT = tuple(f"#{max(0,min(255,int(240 - i * 0.05))):02x}"
+                  f"{max(0,min(255,int(250 - i * 0.04))):02x}"
+                  f"{max(0,min(255,int(255 - i * 0.02))):02x}" for i in range(700))
 
 # --------- Database path (same folder) ----------
 DB_PATH = os.path.join(os.path.dirname(__file__), "parking.db")
 
+# --------- Shared DB connection ----------
+# One long-lived connection in autocommit mode; writes use explicit BEGIN/COMMIT.
+CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                       cached_statements=256)
+CONN.execute("PRAGMA journal_mode=WAL")
+CONN.execute("PRAGMA synchronous=NORMAL")
+CONN.execute("PRAGMA temp_store=MEMORY")
+CONN.execute("PRAGMA cache_size=-20000")
+atexit.register(CONN.close)
+
+# Hot read queries, kept as constants so the statement cache always hits.
+MAIN_TABLE_SQL = """SELECT vehicle_id, vehicle_number, last_slot_number,
+                          datetime(entry_time, 'unixepoch', 'localtime'),
+                          COALESCE(datetime(exit_time, 'unixepoch', 'localtime'), '-') as exit_time
+                   FROM vehicles
+                   ORDER BY vehicle_id DESC LIMIT 50"""
+STATUS_SQL = """SELECT (SELECT COUNT(*) FROM slots),
+                      (SELECT COUNT(*) FROM slots WHERE is_occupied=0),
+                      (SELECT COUNT(*) FROM vehicles WHERE exit_time IS NULL)"""
+
 # --------- DB helper functions ----------
-def get_connection():
-    return sqlite3.connect(DB_PATH)
+@contextmanager
+def transaction(cur, begin="BEGIN"):
+    """Run a block in an explicit transaction, rolling back if anything raises."""
+    cur.execute(begin)
+    try:
+        yield cur
+        cur.execute("COMMIT")
+    except BaseException:
+        if cur.connection.in_transaction:
+            cur.execute("ROLLBACK")
+        raise
+
+def add_column_if_missing(cur, table, column, decl):
+    """Add a column to an existing table; returns True if it was added."""
+    cur.execute(f"PRAGMA table_info({table})")
+    if any(row[1] == column for row in cur.fetchall()):
+        return False
+    cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+    return True
+
+TIMESTAMP_COLUMNS = (("vehicles", ("entry_time", "exit_time")), ("payments", ("payment_time",)))
+
+def retype_timestamp_columns(cur, table, time_columns):
+    """Rebuild a table with its timestamp columns as INTEGER, keeping every other column and constraint."""
+    cur.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,))
+    create_sql = cur.fetchone()[0]
+    for col in time_columns:
+        create_sql = re.sub(rf"""(["`\[]?\b{col}\b["`\]]?\s+)TEXT\b""", r"\1INTEGER", create_sql, count=1, flags=re.I)
+    create_sql = re.sub(r"^CREATE TABLE\s+(\"[^\"]+\"|\[[^\]]+\]|`[^`]+`|\w+)",
+                        f"CREATE TABLE {table}_new", create_sql, count=1, flags=re.I)
+    # Indexes and triggers are dropped with the old table, so recreate them afterwards
+    cur.execute("""SELECT sql FROM sqlite_master
+                   WHERE type IN ('index', 'trigger') AND tbl_name=? AND sql IS NOT NULL""", (table,))
+    extras = [row[0] for row in cur.fetchall()]
+    cur.execute(f"PRAGMA table_info({table})")
+    names = [row[1] for row in cur.fetchall()]
+    # Old rows hold local "%Y-%m-%d %H:%M:%S" strings; epoch values that TEXT affinity
+    # turned into digit strings are cast back as-is rather than parsed as dates
+    select = ", ".join(f"""CASE WHEN "{c}" GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+                                THEN CAST(strftime('%s', "{c}", 'utc') AS INTEGER)
+                                WHEN typeof("{c}")='text' AND "{c}" GLOB '[0-9]*' AND "{c}" NOT GLOB '*[^0-9]*'
+                                THEN CAST("{c}" AS INTEGER)
+                                ELSE "{c}" END""" if c in time_columns else f'"{c}"'
+                       for c in names)
+    columns = ", ".join(f'"{c}"' for c in names)
+    cur.execute(create_sql)
+    cur.execute(f"INSERT INTO {table}_new ({columns}) SELECT {select} FROM {table}")
+    cur.execute(f"DROP TABLE {table}")
+    cur.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    for sql in extras:
+        cur.execute(sql)
+    cur.execute(f"PRAGMA table_info({table})")
+    if any(row[1] in time_columns and row[2].upper() != "INTEGER" for row in cur.fetchall()):
+        raise sqlite3.DatabaseError(f"could not retype timestamp columns of {table} to INTEGER")
+
+def migrate_text_timestamps(cur):
+    """Convert vehicles/payments created with TEXT timestamps to store Unix seconds."""
+    stale = []
+    for table, time_columns in TIMESTAMP_COLUMNS:
+        cur.execute(f"PRAGMA table_info({table})")
+        if any(row[1] in time_columns and row[2].upper() == "TEXT" for row in cur.fetchall()):
+            stale.append((table, time_columns))
+    if not stale:
+        return
+    with transaction(cur):
+        for table, time_columns in stale:
+            retype_timestamp_columns(cur, table, time_columns)
 
 def ensure_tables_exist():
     """Create minimal tables if not exist."""
-    conn = get_connection()
-    cur = conn.cursor()
+    cur = CONN.cursor()
     cur.execute("""
     CREATE TABLE IF NOT EXISTS slots (
         slot_id INTEGER PRIMARY KEY AUTOINCREMENT,
         slot_number TEXT UNIQUE NOT NULL,
-        is_occupied INTEGER DEFAULT 0
+        is_occupied INTEGER DEFAULT 0,
+        slot_index INTEGER
     );""")
+    # Numeric slot order, filled once for databases created before the column existed
+    if add_column_if_missing(cur, "slots", "slot_index", "INTEGER"):
+        cur.execute("""UPDATE slots
+                       SET slot_index = CAST(SUBSTR(slot_number, INSTR(slot_number, '-') + 1) AS INTEGER)""")
+    # Timestamps are stored as integer Unix seconds and formatted only for display
     cur.execute("""
     CREATE TABLE IF NOT EXISTS vehicles (
         vehicle_id INTEGER PRIMARY KEY AUTOINCREMENT,
         owner_name TEXT,
         vehicle_number TEXT UNIQUE,
         slot_id INTEGER,
-        entry_time TEXT,
-        exit_time TEXT,
+        entry_time INTEGER,
+        exit_time INTEGER,
+        last_slot_number TEXT,
         FOREIGN KEY(slot_id) REFERENCES slots(slot_id)
     );""")
     cur.execute("""
@@ -36,14 +135,23 @@ def ensure_tables_exist():
         payment_id INTEGER PRIMARY KEY AUTOINCREMENT,
         vehicle_id INTEGER,
         amount REAL,
-        payment_time TEXT,
+        payment_time INTEGER,
         FOREIGN KEY(vehicle_id) REFERENCES vehicles(vehicle_id)
     );""")
-    conn.commit()
-    conn.close()
-
-# Ensure DB ready
-ensure_tables_exist()
+    migrate_text_timestamps(cur)
+    # Slot name copied onto the vehicle row so the main table needs no join
+    if add_column_if_missing(cur, "vehicles", "last_slot_number", "TEXT"):
+        cur.execute("""UPDATE vehicles
+                       SET last_slot_number = (SELECT slot_number FROM slots WHERE slots.slot_id = vehicles.slot_id)""")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_slots_index ON slots(slot_index)")
+    # Partial index matching the GUI's free-slot lookup
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_slots_free ON slots(slot_id) WHERE is_occupied=0")
+    # vehicle_number is UNIQUE, so its own index already serves the exit lookup
+    cur.execute("DROP INDEX IF EXISTS idx_vehicles_active")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_payments_time ON payments(payment_time DESC)")
+    # Let SQLite analyze only tables whose statistics are missing or stale, with a bounded scan
+    cur.execute("PRAGMA analysis_limit=400")
+    cur.execute("PRAGMA optimize=0x10002")
 
 # --------- GUI root ----------
 root = tk.Tk()
@@ -55,68 +163,69 @@ root.resizable(True, True)
 # ---------- Gradient background ----------
 canvas = tk.Canvas(root, width=1000, height=700, highlightthickness=0)
 canvas.pack(fill="both", expand=True)
-for i in range(700):
-    r = int(240 - i * 0.05)
-    g = int(250 - i * 0.04)
-    b = int(255 - i * 0.02)
-    color = f"#{max(0,min(255,r)):02x}{max(0,min(255,g)):02x}{max(0,min(255,b)):02x}"
-    canvas.create_line(0, i, 1000, i, fill=color)
+# One 1-pixel-wide column of colours, tiled across a single image item.
+bg_image = tk.PhotoImage(width=1000, height=700)
+bg_image.put(tuple((color,) for color in _GRADIENT), to=(0, 0, 1000, 700))
+canvas.create_image(0, 0, image=bg_image, anchor="nw")
 
 # ---------- Animated header ----------
 header_text = canvas.create_text(500, 45, text="🚗 Smart Parking Lot Management System",
                                  font=("Segoe UI", 22, "bold"), fill="#0b486b")
 
-_header_after_id = None
-def animate_header():
-    global _header_after_id
+# ---------- Animated car (emoji version) ----------
+CAR_MIN_X, CAR_MAX_X = 50, 950
+CAR_SPEED = 200  # px per second
+car_text = canvas.create_text(-50, 90, text="🚗", font=("Segoe UI", 26))  # drives in from off-screen
+
+# ---------- Animation loop ----------
+HEADER_COLORS = ("#0b486b", "#987f10", "#6B292E", "#4c93e5", "#6a1b9a")
+HEADER_TICKS = 12  # header colour changes every ~400 ms
+_last_tick = time.monotonic()
+_tick_after_id = None
+_hdr_i = 0
+_hdr_ticks = 0
+_car_x = -50
+_car_dir = 1
+def animate_tick():
+    """Cycles the header colour and moves the car on one ~30 Hz timer."""
+    global _tick_after_id, _hdr_i, _hdr_ticks, _last_tick, _car_x, _car_dir
     try:
         if not (root.winfo_exists() and canvas.winfo_exists()):
             return
     except tk.TclError:
         return
-    colors = ["#0b486b", "#987f10", "#6B292E", "#4c93e5", "#6a1b9a"]
-    color = colors[int(datetime.now().timestamp() * 2) % len(colors)]
-    try:
-        canvas.itemconfig(header_text, fill=color)
-    except tk.TclError:
-        return
-    _header_after_id = root.after(400, animate_header)
-
-animate_header()
-
-# ---------- Animated car (emoji version) ----------
-car_text = canvas.create_text(-50, 90, text="🚗", font=("Segoe UI", 26))
-
-def move_car(x=-50, direction=1):
-    """Makes car move back and forth smoothly."""
+    now = time.monotonic()
+    # Step by elapsed time so a late callback doesn't slow the car down
+    dx = _car_dir * min(CAR_SPEED * (now - _last_tick), CAR_MAX_X - CAR_MIN_X)
+    _last_tick = now
+    edge = CAR_MAX_X if _car_dir == 1 else CAR_MIN_X
+    if (_car_x + dx - edge) * _car_dir > 0:
+        dx = edge - _car_x
+        _car_dir = -_car_dir
     try:
-        if not canvas.winfo_exists():
-            return
+        _hdr_ticks += 1
+        if _hdr_ticks == HEADER_TICKS:
+            _hdr_ticks = 0
+            _hdr_i = (_hdr_i + 1) % len(HEADER_COLORS)
+            canvas.itemconfig(header_text, fill=HEADER_COLORS[_hdr_i])
+        canvas.move(car_text, dx, 0)
+        _car_x += dx
     except tk.TclError:
         return
+    _tick_after_id = root.after(33, animate_tick)
 
-    canvas.coords(car_text, x, 90)
-    if direction == 1:
-        if x < 950:
-            root.after(20, move_car, x + 4, direction)
-        else:
-            root.after(20, move_car, 950, -1)
-    else:
-        if x > 50:
-            root.after(20, move_car, x - 4, direction)
-        else:
-            root.after(20, move_car, 50, 1)
-
-move_car()
+animate_tick()
 
 # ---------- On Close ----------
 def on_app_close():
     try:
-        if _header_after_id is not None:
-            root.after_cancel(_header_after_id)
+        if _tick_after_id is not None:
+            root.after_cancel(_tick_after_id)
     except Exception:
         pass
     root.destroy()
+    CONN.execute("PRAGMA optimize")
+    CONN.close()
 
 root.protocol("WM_DELETE_WINDOW", on_app_close)
 
@@ -134,61 +243,66 @@ btn_style = {"bg": "#96B1C4", "fg": "black", "relief": "ridge", "bd": 2,
              "font": ("Segoe UI", 10, "bold"), "width": 18, "height": 2, "cursor": "hand2"}
 
 # ---------- Core functions ----------
+def fill_tree(tree, cur, batch=500):
+    """Stream cursor rows into a Treeview with raw Tcl insert calls."""
+    call = tree.tk.call
+    while True:
+        rows = cur.fetchmany(batch)
+        if not rows:
+            break
+        for row in rows:
+            call(tree._w, "insert", "", "end", "-values", row)
+
 def refresh_main_table():
-    for r in main_table.get_children():
-        main_table.delete(r)
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""SELECT v.vehicle_id, v.vehicle_number, s.slot_number, v.entry_time, 
-                          COALESCE(v.exit_time, '-') as exit_time
-                   FROM vehicles v LEFT JOIN slots s ON v.slot_id = s.slot_id
-                   ORDER BY v.vehicle_id DESC LIMIT 50""")
-    for row in cur.fetchall():
-        main_table.insert("", "end", values=row)
-    conn.close()
-    update_status_label()
-
-def update_status_label():
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM slots")
-    total = cur.fetchone()[0] or 0
-    cur.execute("SELECT COUNT(*) FROM slots WHERE is_occupied=0")
-    free = cur.fetchone()[0] or 0
-    cur.execute("SELECT COUNT(*) FROM vehicles WHERE exit_time IS NULL")
-    parked = cur.fetchone()[0] or 0
-    conn.close()
+    main_table.delete(*main_table.get_children())
+    cur = CONN.cursor()
+    # Read the counters and table rows from one snapshot, filling the table while it is unmapped.
+    pack = main_table.pack_info()
+    main_table.pack_forget()
+    try:
+        with transaction(cur):
+            cur.execute(STATUS_SQL)
+            counts = cur.fetchone()
+            cur.execute(MAIN_TABLE_SQL)
+            fill_tree(main_table, cur)
+    finally:
+        main_table.pack(**pack)
+    update_status_label(counts)
+
+def update_status_label(counts=None):
+    if counts is None:
+        counts = CONN.execute(STATUS_SQL).fetchone()
+    total, free, parked = (c or 0 for c in counts)
     status_label.config(text=f"Total Slots: {total}   Available: {free}   Currently Parked: {parked}")
 
 def add_vehicle_window():
     def submit():
+        from tkinter import messagebox
         owner = win_owner.get().strip()
         vnum = win_number.get().strip()
         if not vnum:
             messagebox.showwarning("Input", "Please enter a vehicle number.")
             return
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("SELECT slot_id, slot_number FROM slots WHERE is_occupied=0 LIMIT 1")
-        row = cur.fetchone()
-        if not row:
-            conn.close()
-            messagebox.showerror("Full", "No available slots.")
-            return
-        slot_id, slot_no = row
-        entry_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cur = CONN.cursor()
         try:
-            cur.execute("INSERT INTO vehicles (owner_name, vehicle_number, slot_id, entry_time) VALUES (?,?,?,?)",
-                        (owner, vnum, slot_id, entry_time))
-            cur.execute("UPDATE slots SET is_occupied=1 WHERE slot_id=?", (slot_id,))
-            conn.commit()
-            messagebox.showinfo("Parked", f"Vehicle parked in {slot_no}")
-            win.destroy()
-            refresh_main_table()
+            with transaction(cur, "BEGIN IMMEDIATE"):
+                cur.execute("SELECT slot_id, slot_number FROM slots WHERE is_occupied=0 LIMIT 1")
+                row = cur.fetchone()
+                if row:
+                    slot_id, slot_no = row
+                    entry_time = int(time.time())
+                    cur.execute("""INSERT INTO vehicles (owner_name, vehicle_number, slot_id, entry_time, last_slot_number)
+                                   VALUES (?,?,?,?,?)""", (owner, vnum, slot_id, entry_time, slot_no))
+                    cur.execute("UPDATE slots SET is_occupied=1 WHERE slot_id=?", (slot_id,))
         except sqlite3.IntegrityError:
             messagebox.showerror("Error", "Vehicle number already exists.")
-        finally:
-            conn.close()
+            return
+        if not row:
+            messagebox.showerror("Full", "No available slots.")
+            return
+        messagebox.showinfo("Parked", f"Vehicle parked in {slot_no}")
+        win.destroy()
+        refresh_main_table()
 
     win = tk.Toplevel(root)
     win.title("Park Vehicle")
@@ -204,33 +318,31 @@ def add_vehicle_window():
 
 def exit_vehicle_window():
     def submit_exit():
+        from tkinter import messagebox
         vnum = win_number.get().strip()
         if not vnum:
             messagebox.showwarning("Input", "Please enter vehicle number.")
             return
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""SELECT v.vehicle_id, v.entry_time, v.slot_id, s.slot_number
-                       FROM vehicles v JOIN slots s ON v.slot_id = s.slot_id
-                       WHERE v.vehicle_number=? AND v.exit_time IS NULL""", (vnum,))
-        rec = cur.fetchone()
+        cur = CONN.cursor()
+        now = int(time.time())
+        with transaction(cur, "BEGIN IMMEDIATE"):
+            cur.execute("""UPDATE vehicles SET exit_time=?
+                           WHERE vehicle_number=? AND exit_time IS NULL
+                           RETURNING vehicle_id, slot_id, entry_time""", (now, vnum))
+            rec = cur.fetchone()
+            if rec:
+                vehicle_id, slot_id, entry_time = rec
+                minutes = max(1, (now - entry_time) // 60)
+                rate_per_min = 1.0
+                amount = round(minutes * rate_per_min, 2)
+                cur.execute("UPDATE slots SET is_occupied=0 WHERE slot_id=? RETURNING slot_number", (slot_id,))
+                slot = cur.fetchone()
+                slot_no = slot[0] if slot else "-"
+                cur.execute("INSERT INTO payments (vehicle_id, amount, payment_time) VALUES (?, ?, ?)",
+                            (vehicle_id, amount, now))
         if not rec:
-            conn.close()
             messagebox.showerror("Not found", "No active parked vehicle with this number.")
             return
-        vehicle_id, entry_time_str, slot_id, slot_no = rec
-        entry_dt = datetime.strptime(entry_time_str, "%Y-%m-%d %H:%M:%S")
-        now = datetime.now()
-        minutes = int((now - entry_dt).total_seconds() / 60)
-        minutes = max(1, minutes)
-        rate_per_min = 1.0
-        amount = round(minutes * rate_per_min, 2)
-        cur.execute("UPDATE vehicles SET exit_time=? WHERE vehicle_id=?", (now.strftime("%Y-%m-%d %H:%M:%S"), vehicle_id))
-        cur.execute("UPDATE slots SET is_occupied=0 WHERE slot_id=?", (slot_id,))
-        cur.execute("INSERT INTO payments (vehicle_id, amount, payment_time) VALUES (?, ?, ?)",
-                    (vehicle_id, amount, now.strftime("%Y-%m-%d %H:%M:%S")))
-        conn.commit()
-        conn.close()
         messagebox.showinfo("Payment", f"Vehicle: {vnum}\nSlot: {slot_no}\nDuration: {minutes} min\nAmount: ₹{amount}")
         win.destroy()
         refresh_main_table()
@@ -253,15 +365,13 @@ def view_parked_window():
     for col in ("Owner","Vehicle","Slot","Entry"):
         tree.heading(col, text=col)
         tree.column(col, anchor="center", width=180)
-    tree.pack(expand=True, fill="both", padx=8, pady=8)
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""SELECT v.owner_name, v.vehicle_number, s.slot_number, v.entry_time
+    cur = CONN.cursor()
+    cur.execute("""SELECT v.owner_name, v.vehicle_number, s.slot_number,
+                          datetime(v.entry_time, 'unixepoch', 'localtime')
                    FROM vehicles v JOIN slots s ON v.slot_id=s.slot_id
                    WHERE v.exit_time IS NULL ORDER BY v.entry_time DESC""")
-    for row in cur.fetchall():
-        tree.insert("", "end", values=row)
-    conn.close()
+    fill_tree(tree, cur)
+    tree.pack(expand=True, fill="both", padx=8, pady=8)
 
 def payments_window():
     win = tk.Toplevel(root)
@@ -271,17 +381,14 @@ def payments_window():
     for col in ("Vehicle","Amount","Time"):
         tree.heading(col, text=col)
         tree.column(col, anchor="center", width=180)
-    tree.pack(expand=True, fill="both", padx=8, pady=8)
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""SELECT v.vehicle_number, p.amount, p.payment_time
+    cur = CONN.cursor()
+    cur.execute("""SELECT v.vehicle_number, p.amount, datetime(p.payment_time, 'unixepoch', 'localtime')
                    FROM payments p JOIN vehicles v ON p.vehicle_id=v.vehicle_id
                    ORDER BY p.payment_time DESC""")
-    for row in cur.fetchall():
-        tree.insert("", "end", values=row)
+    fill_tree(tree, cur)
+    tree.pack(expand=True, fill="both", padx=8, pady=8)
     cur.execute("SELECT COALESCE(SUM(amount),0) FROM payments")
     total = cur.fetchone()[0] or 0
-    conn.close()
     tk.Label(win, text=f"Total Revenue: ₹{round(total,2)}", font=("Segoe UI", 12, "bold")).pack(pady=6)
 
 def slot_status_window():
@@ -293,19 +400,13 @@ def slot_status_window():
     for c in ("Slot","Status"):
         table.heading(c, text=c)
         table.column(c, anchor="center", width=200)
+    cur = CONN.cursor()
+    cur.execute("""SELECT slot_number, CASE WHEN is_occupied THEN 'Occupied' ELSE 'Available' END
+                   FROM slots ORDER BY slot_index""")
+    fill_tree(table, cur)
     table.pack(expand=True, fill="both", padx=12, pady=12)
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""SELECT slot_number, is_occupied 
-                   FROM slots 
-                   ORDER BY CAST(SUBSTR(slot_number, INSTR(slot_number, '-') + 1) AS INTEGER)""")
-    rows = cur.fetchall()
-    conn.close()
-    for s, occ in rows:
-        status = "Occupied" if occ else "Available"
-        table.insert("", "end", values=(s, status))
-    total = len(rows)
-    occupied = sum(1 for _, occ in rows if occ)
+    cur.execute("SELECT COUNT(*), COALESCE(SUM(is_occupied != 0), 0) FROM slots")
+    total, occupied = cur.fetchone()
     available = total - occupied
     tk.Label(win, text=f"Total Slots: {total} | Occupied: {occupied} | Available: {available}",
              font=("Segoe UI", 11, "bold"), bg="#F1F6F6").pack(pady=8)
@@ -326,6 +427,7 @@ def add_slots_window():
     entry.pack(pady=5)
 
     def update_slots():
+        from tkinter import messagebox
         try:
             total = int(entry.get().strip())
             if total <= 0:
@@ -334,20 +436,12 @@ def add_slots_window():
             messagebox.showerror("Invalid", "Enter a valid positive number.")
             return
 
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""CREATE TABLE IF NOT EXISTS slots (
-                        slot_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        slot_number TEXT UNIQUE NOT NULL,
-                        is_occupied INTEGER DEFAULT 0
-                       );""")
-        for i in range(1, total + 1):
-            slot_name = f"Slot-{i}"
-            cur.execute("INSERT OR IGNORE INTO slots (slot_number, is_occupied) VALUES (?, 0)", (slot_name,))
-        conn.commit()
+        cur = CONN.cursor()
+        with transaction(cur):
+            cur.executemany("INSERT OR IGNORE INTO slots (slot_number, is_occupied, slot_index) VALUES (?, 0, ?)",
+                            ((f"Slot-{i}", i) for i in range(1, total + 1)))
         cur.execute("SELECT COUNT(*) FROM slots")
         count = cur.fetchone()[0]
-        conn.close()
 
         messagebox.showinfo(" Success", f"Slots updated!\nTotal slots: {count}")
         win.destroy()
@@ -391,6 +485,10 @@ for c in columns:
     main_table.column(c, anchor="center", width=160)
 main_table.pack(expand=True, fill="both", padx=12, pady=8)
 
-# Initialize and run
-refresh_main_table()
+# Initialize and run; schema checks and the first load wait until the window is drawn
+def startup():
+    ensure_tables_exist()
+    refresh_main_table()
+
+root.after_idle(startup)
 root.mainloop()